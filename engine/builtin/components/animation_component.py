@@ -7,12 +7,18 @@ from ...core.world.component import Component
 from ...animation.animation import Animation
 
 class AnimationComponent(Component):
+    # Exclude cached tinted frames from serialization
+    __serialization_exclude__ = ["_tinted_frames", "_tinted_for", "_tinted_animation"]
+
     def __init__(self, frames, tint=(255, 255, 255)):
         super().__init__()
         self.animation = Animation(frames)
         self.tint = tint
         self.timer = 0
         self.frame_index = 0
+        self._tinted_frames = {}  # frame index -> tinted copy, built on first use
+        self._tinted_for = None  # tint the cached frames were built with
+        self._tinted_animation = None  # animation the cached frames were built from
     
     def update(self, delta_time):
         super().update(delta_time)
@@ -23,9 +29,24 @@ class AnimationComponent(Component):
     def currentFrame(self):
         return self.animation.frames[self.frame_index].surface
 
+    def _get_tinted_frame(self):
+        """Get the current frame with the tint applied, tinting each frame only once."""
+        tint = tuple(pygame.Color(self.tint))  # Copy so in-place edits to the tint invalidate the cache
+        if self._tinted_for != tint or self._tinted_animation is not self.animation:
+            self._tinted_frames.clear()
+            self._tinted_for = tint
+            self._tinted_animation = self.animation
+        frame = self._tinted_frames.get(self.frame_index)
+        if frame is None:
+            frame = copy(self.currentFrame)
+            frame.fill(self.tint, special_flags=pygame.BLEND_MULT)
+            self._tinted_frames[self.frame_index] = frame
+        return frame
+
     def render(self):
         super().render()
-        frame = copy(self.currentFrame)
         if (self.tint != (255, 255, 255)):
-            frame.fill(self.tint, special_flags=pygame.BLEND_MULT)
+            frame = self._get_tinted_frame()
+        else:
+            frame = self.currentFrame
         Game().buffer.blit(frame, self.actor.screenPosition)
@@ -1,5 +1,6 @@
 import pygame
 from ...core.world.component import Component
+from ...core.game import Game
 
 class BasicMovementComponent(Component):
     def __init__(self, speed: float = 100):
@@ -11,7 +12,7 @@ class BasicMovementComponent(Component):
 
         move = pygame.Vector2(0, 0)
 
-        keys = pygame.key.get_pressed()
+        keys = Game().keys
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
             move.x -= 1
         if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
@@ -4,21 +4,35 @@ from ...core.world.component import Component
 from ...core.game import Game
 
 class BoxRendererComponent(Component):
+    # Exclude cached surfaces from serialization
+    __serialization_exclude__ = ["_rotated_surface", "_rotated_key"]
+
     def __init__(self, size=(50, 50), color=(255, 255, 255)):
         super().__init__()
         self.size = size
         self.color = color
+        self._rotated_surface = None  # Last rotated box, reused while size/color/rotation are unchanged
+        self._rotated_key = None
+
+    def _get_rotated_surface(self):
+        """Get the filled and rotated box surface, rebuilding it only when its inputs change."""
+        rotation = self.actor.transform.rotation
+        key = (tuple(self.size), tuple(pygame.Color(self.color)), rotation)  # Copy values so in-place edits invalidate the cache
+        if self._rotated_surface is None or self._rotated_key != key:
+            # Create and rotate rectangle surface
+            width, height = self.size
+            surf = pygame.Surface((width, height), pygame.SRCALPHA)
+            surf.fill(self.color)
+            self._rotated_surface = pygame.transform.rotate(surf, -rotation * 57.2958)  # Radians to degrees
+            self._rotated_key = key
+        return self._rotated_surface
 
     def render(self):
         screen = Game().buffer
 
-        width, height = self.size
         center = self.actor.screenPosition
 
-        # Create and rotate rectangle surface
-        surf = pygame.Surface((width, height), pygame.SRCALPHA)
-        surf.fill(self.color)
-        rotated = pygame.transform.rotate(surf, -self.actor.transform.rotation * 57.2958)  # Radians to degrees
+        rotated = self._get_rotated_surface()
         rect = rotated.get_rect(center=center)
 
         screen.blit(rotated, rect.topleft)
@@ -17,5 +17,6 @@ class CameraComponent(Component):
         else:
             self.position = self.actor.transform.position
 
-        Game().current_scene.worldOffset = self.position - pygame.Vector2(Game().width//2, Game().height//2) # type: ignore
+        game = Game()
+        game.current_scene.worldOffset = self.position - (game.width//2, game.height//2) # type: ignore
         return super().lateUpdate(delta_time)
\ No newline at end of file
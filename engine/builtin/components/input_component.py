@@ -190,26 +190,9 @@ class InputComponent(Component):
         """Update the input component."""
         super().update(dt)
         
-        # Update key states based on current pygame state
-        all_keys = pygame.key.get_pressed()
-        current_pressed = set()
-        
-        for key_code in range(len(all_keys)):
-            if all_keys[key_code]:
-                current_pressed.add(key_code)
-                
-        # Update our tracked state
-        self._pressed_keys = current_pressed
-        
-        # Update mouse states
-        mouse_pressed = pygame.mouse.get_pressed()
-        mouse_current = set()
-        for i, pressed in enumerate(mouse_pressed):
-            if pressed:
-                mouse_current.add(i + 1)  # pygame uses 0-based, we use 1-based
-                
-        self._pressed_mouse = mouse_current
-        self._pressed_keys = current_pressed
+        # Update key states from the per-frame keyboard snapshot
+        keys = Game().keys
+        self._pressed_keys = {key_code for key_code in range(len(keys)) if keys[key_code]}
         
         # Update mouse button states
         mouse_buttons = pygame.mouse.get_pressed()
@@ -1,7 +1,13 @@
+import functools
 import pymunk
 
 from .physics_component import PhysicsComponent
 
+@functools.lru_cache(maxsize=256)
+def _circle_moment(mass: float, radius: float) -> float:
+    """Cached moment of inertia for a solid circle of the given mass and radius."""
+    return pymunk.moment_for_circle(mass, 0, radius)
+
 class PhysicsCircleComponent(PhysicsComponent):
     """
     A component that represents a circular physics body.
@@ -16,5 +22,5 @@ class PhysicsCircleComponent(PhysicsComponent):
         :param radius: The radius of the circle.
         """
         self.radius = radius
-        body = pymunk.Body(mass, pymunk.moment_for_circle(mass, 0, radius), bodyType)
+        body = pymunk.Body(mass, _circle_moment(mass, radius), bodyType)
         super().__init__(body, [pymunk.Circle(body, radius)])
\ No newline at end of file
@@ -5,14 +5,24 @@ from .constraint_component import DampedSpringComponent
 from ...core.game import Game
 
 class SpringRendererComponent(Component):
+    # Exclude the cached spring lookup from serialization
+    __serialization_exclude__ = ["_spring"]
+
     def __init__(self, other_actor):
         super().__init__()
         self.other_actor = other_actor
+        self._spring = None  # Cached DampedSpringComponent on our actor
+
+    def _get_spring(self):
+        """Get the actor's spring component, only searching again if the cached one was removed."""
+        if self._spring is None or self._spring.actor is not self.actor:
+            self._spring = self.actor.get_component(DampedSpringComponent)
+        return self._spring
 
     def render(self):
         surface = Game().buffer
         other = self.other_actor
-        spring = self.actor.get_component(DampedSpringComponent)
+        spring = self._get_spring()
         if not other or not spring:
             return
         pos1 = self.actor.transform.position
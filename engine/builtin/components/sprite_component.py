@@ -12,7 +12,7 @@ class SpriteComponent(Component):
     """
     
     # Exclude cache-related fields from serialization
-    __serialization_exclude__ = ["_cached_surface", "_cache_dirty"]
+    __serialization_exclude__ = ["_cached_surface", "_cache_dirty", "_transformed_surface", "_transformed_key"]
     
     def __init__(self, sprite_name: str = None, tint_color: pygame.Color = None):
         super().__init__()
@@ -38,6 +38,10 @@ class SpriteComponent(Component):
         self._cached_surface: Optional[pygame.Surface] = None
         self._cache_dirty: bool = True
         
+        # Cached scaled/rotated surface, reused while scale and rotation are unchanged
+        self._transformed_surface: Optional[pygame.Surface] = None
+        self._transformed_key: Optional[tuple] = None
+        
     def set_sprite(self, sprite_name: str) -> None:
         """Set the sprite asset name."""
         if self.sprite_name != sprite_name:
@@ -68,6 +72,8 @@ class SpriteComponent(Component):
         """Mark the cached surface as dirty."""
         self._cache_dirty = True
         self._cached_surface = None
+        self._transformed_surface = None
+        self._transformed_key = None
         
     def _get_base_surface(self) -> Optional[pygame.Surface]:
         """Get the base surface from the asset manager."""
@@ -164,24 +170,30 @@ class SpriteComponent(Component):
         final_pos = self.actor.screenPosition + self.offset
         
         # Apply scaling
-        final_scale = pygame.Vector2(
-            self.actor.transform.scale.x * self.scale_modifier.x,
-            self.actor.transform.scale.y * self.scale_modifier.y
-        )
-        
-        # Scale the surface if needed
-        if final_scale.x != 1 or final_scale.y != 1:
-            new_size = (
-                int(sprite_surface.get_width() * final_scale.x),
-                int(sprite_surface.get_height() * final_scale.y)
-            )
-            if new_size[0] > 0 and new_size[1] > 0:
-                sprite_surface = pygame.transform.scale(sprite_surface, new_size)
-            
-        # Apply rotation
+        scale_x = self.actor.transform.scale.x * self.scale_modifier.x
+        scale_y = self.actor.transform.scale.y * self.scale_modifier.y
         final_rotation = self.actor.transform.rotation + self.rotation_offset
-        if final_rotation != 0:
-            sprite_surface = pygame.transform.rotate(sprite_surface, -final_rotation)  # Negative for clockwise
+        
+        # Reuse the transformed surface if scale and rotation haven't changed
+        transform_key = (scale_x, scale_y, final_rotation)
+        if self._transformed_surface is not None and self._transformed_key == transform_key:
+            sprite_surface = self._transformed_surface
+        else:
+            # Scale the surface if needed
+            if scale_x != 1 or scale_y != 1:
+                new_size = (
+                    int(sprite_surface.get_width() * scale_x),
+                    int(sprite_surface.get_height() * scale_y)
+                )
+                if new_size[0] > 0 and new_size[1] > 0:
+                    sprite_surface = pygame.transform.scale(sprite_surface, new_size)
+                
+            # Apply rotation
+            if final_rotation != 0:
+                sprite_surface = pygame.transform.rotate(sprite_surface, -final_rotation)  # Negative for clockwise
+                
+            self._transformed_surface = sprite_surface
+            self._transformed_key = transform_key
             
         # Calculate render position (center the sprite)
         render_rect = sprite_surface.get_rect()
@@ -1,11 +1,14 @@
 import pygame
 import os
 import json
+import logging
 from typing import Dict, Optional, Any, List
 from pathlib import Path
 
 from engine.core.singleton import singleton
 
+logger = logging.getLogger(__name__)
+
 @singleton
 class AssetManager:
     """
@@ -323,7 +326,7 @@ class AssetManager:
                         self.loadFont(file.stem)  # Use file.stem to remove suffix
                     elif asset_type == "data" and file.suffix.lower() == ".json":
                         self.loadData(file.stem)  # Use file.stem to remove suffix
-                    print(f"Autoloaded {asset_type}: {file.name}")
+                    logger.debug("Autoloaded %s: %s", asset_type, file.name)
                 
     def cleanup(self) -> None:
         """Clean up all loaded assets."""
@@ -10,7 +10,7 @@ from .rendering.shader import Shader, DEFAULT_VERT, DEFAULT_FRAG
 
 @singleton
 class Game:
-    def __init__(self, width=1280, height=720, title="OpenGL Game", fullscreen=False):
+    def __init__(self, width=1280, height=720, title="OpenGL Game", fullscreen=False, target_fps=0):
         print("Initializing Game...")
 
         pygame.init()
@@ -23,11 +23,19 @@ class Game:
         self.ctx.blend_func = (moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA)
 
         self.clock = pygame.time.Clock()
+        self.target_fps = target_fps  # Frame rate cap for the main loop (0 = uncapped)
         self.running = True
         self.width = width
         self.height = height
         self.last_time = time.time()
         self.delta_time = 0.1
+        self.keys = pygame.key.get_pressed()  # Keyboard snapshot, refreshed once per frame
+
+        # Engine-level event handlers, looked up by event type
+        self.event_handlers = {
+            pygame.QUIT: self.on_quit,
+            pygame.VIDEORESIZE: self.on_resize,
+        }
 
         self.scenes = {}
         self.current_scene = None
@@ -166,20 +174,25 @@ class Game:
 # endregion
 
     def handle_event(self, event):
-        if event.type == pygame.QUIT:
-            self.running = False
-        elif event.type == pygame.VIDEORESIZE:
-            self.width, self.height = event.size
-            pygame.display.set_mode((self.width, self.height), self.flags)
-            self.ctx.viewport = (0, 0, self.width, self.height)
-            self.init_framebuffers()
-            # Reinitialize the buffer to match the new resolution
-            self.buffer = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            # Debugging: Print new dimensions
-            print(f"Resolution changed: {self.width}x{self.height}")
+        handler = self.event_handlers.get(event.type)
+        if handler:
+            handler(event)
         elif self.current_scene:
             self.current_scene.handle_event(event)
 
+    def on_quit(self, event):
+        self.running = False
+
+    def on_resize(self, event):
+        self.width, self.height = event.size
+        pygame.display.set_mode((self.width, self.height), self.flags)
+        self.ctx.viewport = (0, 0, self.width, self.height)
+        self.init_framebuffers()
+        # Reinitialize the buffer to match the new resolution
+        self.buffer = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        # Debugging: Print new dimensions
+        print(f"Resolution changed: {self.width}x{self.height}")
+
     def update(self, dt):
         if self.current_scene:
             self.current_scene.update(dt)
@@ -219,13 +232,15 @@ class Game:
             src_tex = self.ping_tex if i % 2 == 0 else self.pong_tex
 
     def run(self):
+        handle_event = self.handle_event
         while self.running:
             for event in pygame.event.get():
-                self.handle_event(event)
+                handle_event(event)
+            self.keys = pygame.key.get_pressed()
 
             self.update(self.delta_time)
             self.render()
             pygame.display.flip()
-            self.delta_time = min(max(float(self.clock.tick())/1000, 0), 1)
+            self.delta_time = min(max(float(self.clock.tick(self.target_fps))/1000, 0), 1)
 
         pygame.quit()
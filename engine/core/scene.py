@@ -45,22 +45,18 @@ class Scene:
     def add_physics(self, actor):
         """Add an actor's physics body to the scene's physics space."""
         from ..builtin.components.physics_component import PhysicsComponent
-        physics_component = actor.getComponent(PhysicsComponent, allow_inheritance=True)
+        physics_component = actor.get_component(PhysicsComponent, allow_inheritance=True)
         if physics_component and physics_component.body:
-            self.physics_space.add(physics_component.body)
-            # Also add all shapes associated with the body
-            for shape in physics_component.shapes:
-                self.physics_space.add(shape)
+            # Add the body and all its shapes in a single call
+            self.physics_space.add(physics_component.body, *physics_component.shapes)
 
     def remove_physics(self, actor):
         """Remove an actor's physics body from the scene's physics space."""
         from ..builtin.components.physics_component import PhysicsComponent
-        physics_component = actor.getComponent(PhysicsComponent, allow_inheritance=True)
+        physics_component = actor.get_component(PhysicsComponent, allow_inheritance=True)
         if physics_component and physics_component.body:
-            self.physics_space.remove(physics_component.body)
-            # Also remove all shapes associated with the body
-            for shape in physics_component.shapes:
-                self.physics_space.remove(shape)
+            # Remove the body and all its shapes in a single call
+            self.physics_space.remove(physics_component.body, *physics_component.shapes)
             
 #endregion
 
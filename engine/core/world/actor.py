@@ -1,6 +1,12 @@
+import logging
+
 from pygame import Vector2
 
+logger = logging.getLogger(__name__)
+
 class Transform:
+    __slots__ = ("position", "rotation", "scale")
+
     def __init__(self):
         self.position = Vector2(0,0)  # (x, y)
         self.rotation = 0  # in degrees
@@ -8,7 +14,7 @@ class Transform:
 
     def setPosition(self, x: float, y: float) -> None:
         """Set the position of the transform."""
-        self.position = Vector2(x, y)
+        self.position.update(x, y)  # In place, avoids allocating a new Vector2
 
     def setRotation(self, rotation: float) -> None:
         """Set the rotation of the transform."""
@@ -16,7 +22,7 @@ class Transform:
 
     def setScale(self, scale_x: float, scale_y: float) -> None:
         """Set the scale of the transform."""
-        self.scale = Vector2(scale_x, scale_y)
+        self.scale.update(scale_x, scale_y)
 
     def serialize(self) -> dict:
         """Serialize the transform to a dictionary."""
@@ -63,7 +69,7 @@ class Actor():
         """Stop the actor and its components."""
         for component in self.components:
             component.stop()
-        print(f"Actor {self.name} stopped with {len(self.components)} components.")
+        logger.debug("Actor %s stopped with %d components.", self.name, len(self.components))
 
     def setName(self, name: str) -> None:
         """Set the name of the actor."""
@@ -74,7 +80,7 @@ class Actor():
         assert component not in self.components, "Component already exists in actor"
         self.components.append(component)
         component.setActor(self)
-        print(f"Added component {component.__class__.__name__} to actor {self.name}")
+        logger.debug("Added component %s to actor %s", component.__class__.__name__, self.name)
 
     def add_components(self, *args) -> None:
         """Add multiple components to the actor."""
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+import functools
 import importlib
 import sys
 
@@ -133,18 +134,12 @@ class Component(ABC):
 
     
     @staticmethod
-    def createFromData(data: dict):
+    @functools.lru_cache(maxsize=None)
+    def _resolveComponentClass(component_module: str, component_type: str):
         """
-        Create a component instance from serialized data.
+        Import and return the component class for a module/type pair.
+        Results are cached so repeated deserialization skips the import machinery.
         """
-        component_type = data.get("type")
-        if not component_type:
-            raise ValueError("Serialized data must contain a 'type' field.")
-
-        component_module = data.get("module")
-        if not component_module:
-            raise ValueError("Serialized data must contain a 'module' field.")
-
         # Dynamically import the module and get the class
         try:
             if component_module == "__main__":
@@ -160,6 +155,22 @@ class Component(ABC):
         except (ImportError, AttributeError) as e:
             raise ValueError(f"Cannot find component class {component_type} in module {component_module}: {e}")
 
+        return component_class
+
+    @staticmethod
+    def createFromData(data: dict):
+        """
+        Create a component instance from serialized data.
+        """
+        component_type = data.get("type")
+        if not component_type:
+            raise ValueError("Serialized data must contain a 'type' field.")
+
+        component_module = data.get("module")
+        if not component_module:
+            raise ValueError("Serialized data must contain a 'module' field.")
+
+        component_class = Component._resolveComponentClass(component_module, component_type)
         component = component_class()
         component.deserialize(data)
         return component
\ No newline at end of file
@@ -1,4 +1,6 @@
 #Library imports
+import cProfile
+import os
 import pygame
 
 # Core engine imports
@@ -18,7 +20,14 @@ def main():
     game.add_scene(PanoScene())
     game.load_scene("Pano Scene")
 
-    game.run()
+    # Set WW_PROFILE=<file>.prof to record a cProfile of the main loop (view with snakeviz)
+    profile_path = os.environ.get("WW_PROFILE")
+    if profile_path:
+        profiler = cProfile.Profile()
+        profiler.runcall(game.run)
+        profiler.dump_stats(profile_path)
+    else:
+        game.run()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,67 @@
+import os
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from engine.animation.animation import Animation
+from engine.builtin.components import animation_component
+from engine.builtin.components.animation_component import AnimationComponent
+
+def white_frame(size=4):
+    surface = pygame.Surface((size, size))
+    surface.fill((255, 255, 255))
+    return surface
+
+@pytest.fixture
+def buffer(monkeypatch):
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    game = SimpleNamespace(buffer=pygame.Surface((32, 32)))
+    monkeypatch.setattr(animation_component, "Game", lambda: game)
+    yield game.buffer
+    pygame.display.quit()
+
+def make_component(frames, tint):
+    component = AnimationComponent(frames, tint=tint)
+    component.actor = SimpleNamespace(screenPosition=(0, 0))
+    return component
+
+def test_untinted_frames_are_blitted_without_caching(buffer):
+    frame = white_frame()
+    component = make_component([frame], (255, 255, 255))
+    component.render()
+
+    assert component._tinted_frames == {}
+    assert buffer.get_at((0, 0)) == pygame.Color(255, 255, 255)
+
+def test_in_place_tint_edit_rebuilds_frames(buffer):
+    tint = [255, 0, 0]
+    component = make_component([white_frame()], tint)
+    component.render()
+    assert buffer.get_at((0, 0)) == pygame.Color(255, 0, 0)
+
+    tint[0] = 0
+    tint[1] = 255
+    component.render()
+    assert buffer.get_at((0, 0)) == pygame.Color(0, 255, 0)
+
+def test_int_tint_is_accepted(buffer):
+    frame = white_frame()
+    component = make_component([frame], 0x0000FFFF)
+    component.render()
+
+    expected = frame.copy()
+    expected.fill(0x0000FFFF, special_flags=pygame.BLEND_MULT)
+    assert buffer.get_at((0, 0)) == expected.get_at((0, 0))
+
+def test_animation_swap_rebuilds_frames(buffer):
+    component = make_component([white_frame(4)], (255, 0, 0))
+    component.render()
+
+    component.animation = Animation([white_frame(8)])
+    component.render()
+
+    assert component._tinted_frames[0].get_width() == 8
@@ -0,0 +1,51 @@
+import os
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from engine.builtin.components import input_component
+from engine.builtin.components.input_component import InputComponent
+
+class FakeKeyState:
+    """Stands in for pygame's ScancodeWrapper: indexable by keycode, not iterable."""
+    def __init__(self, *pressed):
+        self.pressed = set(pressed)
+
+    def __len__(self):
+        return 512
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+    def __iter__(self):
+        raise TypeError("Iterating over key states is not supported")
+
+@pytest.fixture
+def display():
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.display.quit()
+
+def test_update_reads_real_key_snapshot(display, monkeypatch):
+    game = SimpleNamespace(keys=pygame.key.get_pressed())
+    monkeypatch.setattr(input_component, "Game", lambda: game)
+
+    component = InputComponent()
+    component.update(0.016)
+
+    assert component.get_pressed_keys() == set()
+
+def test_update_tracks_keycodes(display, monkeypatch):
+    game = SimpleNamespace(keys=FakeKeyState(pygame.K_a, pygame.K_SPACE))
+    monkeypatch.setattr(input_component, "Game", lambda: game)
+
+    component = InputComponent()
+    component.update(0.016)
+
+    assert component.is_key_pressed(pygame.K_a)
+    assert component.is_key_pressed(pygame.K_SPACE)
+    assert not component.is_key_pressed(pygame.K_d)
@@ -15,8 +15,9 @@ class PanoramaCameraControllerComponent(Component):
         super().__init__()
         self.speed = speed
         self.margin_distance = margin_distance
-        self.max_left = -Game().width
-        self.max_right = Game().width
+        game = Game()
+        self.max_left = -game.width
+        self.max_right = game.width
 
     def update(self, delta_time):
         """Update the camera position based on user input."""